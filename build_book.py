@@ -1,9 +1,16 @@
 """Generate a simple 8.5×8.5 inch picture book PDF."""
 
+import hashlib
+import io
 import os
 import argparse
-from typing import Union
-from PIL import Image, ImageDraw, ImageFont, ImageOps
+from contextlib import nullcontext
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from typing import Iterator, Union
+import img2pdf
+from PIL import Image, ImageDraw, ImageFont
+from PIL import __version__ as PIL_VERSION
 
 # Constants for an 8.5×8.5 inch square book at 300 dpi
 # Use 300 pixels per inch so that the output PDF meets KDP’s resolution
@@ -20,26 +27,33 @@ TRIM_HEIGHT_IN = 8.5
 PAGE_WIDTH_IN = TRIM_WIDTH_IN + (0.125 if USE_BLEED else 0)
 PAGE_HEIGHT_IN = TRIM_HEIGHT_IN + (0.25 if USE_BLEED else 0)
 
-# Define the finished page dimensions in pixels.
-PAGE_SIZE = (PAGE_WIDTH_IN * INCH, PAGE_HEIGHT_IN * INCH)
+# Define the finished page dimensions in whole pixels.  With bleed the width
+# is 2587.5px; every page (text and illustration) rounds it the same way.
+PAGE_SIZE = (int(round(PAGE_WIDTH_IN * INCH)), int(round(PAGE_HEIGHT_IN * INCH)))
 
 # Margin around text content (in pixels). KDP requires at least 0.25″ without
 # bleed or 0.375″ with bleed. Match the appropriate value so nothing is
 # trimmed during printing.
 MARGIN = int((0.375 if USE_BLEED else 0.25) * INCH)
 
+# Inner panel behind the text, identical on every text page.  Page numbers
+# are not printed, so no extra space is reserved at the bottom.
+# ``PANEL_PADDING`` is the internal padding between the panel edge and text.
+PANEL_RECT = (MARGIN, MARGIN, PAGE_SIZE[0] - MARGIN, PAGE_SIZE[1] - MARGIN)
+PANEL_PADDING = 40
+TEXT_MAX_WIDTH = PANEL_RECT[2] - PANEL_RECT[0] - 2 * PANEL_PADDING
+TEXT_MAX_HEIGHT = PANEL_RECT[3] - PANEL_RECT[1] - 2 * PANEL_PADDING
+
 # Base font size for body text.  This value will be scaled down if the
-# paragraph is too long to comfortably fit within the available area.  A
-# slightly smaller default makes it easier to accommodate longer sentences
-# while still maintaining a child‑friendly appearance.
+# paragraph is too long to comfortably fit within the available area.
 # Scale font sizes relative to the DPI so text remains legible when
-# increasing resolution. The original script used a 75 dpi canvas with
-# a minimum font size of 20 px. At 300 dpi that equates to roughly
-# 80 px. ``FONT_SIZE`` starts slightly smaller so long passages can be
-# scaled down if needed, while ``MIN_FONT_SIZE`` represents the target
-# size for normal pages.
-FONT_SIZE = int(INCH * 0.1333)  # ~40px at 300 dpi
-MIN_FONT_SIZE = int(INCH * 0.2667)  # ~80px at 300 dpi
+# increasing resolution. The original script used a 75 dpi canvas with
+# a minimum font size of 20 px. At 300 dpi that equates to roughly
+# 80 px, which is the size normal pages use.  Long passages shrink towards
+# ``MIN_FONT_SIZE``, the smallest size still comfortable to read in print,
+# rather than overflowing the panel.
+FONT_SIZE = int(INCH * 0.2667)  # ~80px at 300 dpi
+MIN_FONT_SIZE = int(INCH * 0.1)  # ~30px at 300 dpi
 
 # Colours used throughout the book.  Pastel shades are deliberately chosen
 # because they are soft and appealing to children.  New pages cycle through
@@ -52,17 +66,42 @@ BACKGROUND_COLOURS = [
     (255, 240, 245),  # lavender blush
 ]
 
+# JPEG quality used when rendered pages are encoded for the manuscript PDF.
+JPEG_QUALITY = 90
+
+# Rendered text pages are cached on disk per book.  Bump the version whenever
+# the text page layout changes so stale pages are not reused.
+TEXT_CACHE_DIR = os.path.join('.cache', 'text')
+TEXT_CACHE_VERSION = 1
+
 TEXT_COLOUR = (40, 40, 40)  # dark grey for comfortable reading
 PANEL_FILL = (255, 255, 255)  # white panel behind text for contrast
 
 # Book configuration
 BOOKS_DIR = 'books'
 
+# Font files that loaded successfully, remembered so later sizes skip the
+# candidate walk.  ``None`` means no candidate was usable.
+_FONT_PATH: Union[str, None] = None
+_HEADING_FONT_PATH: Union[str, None] = None
+
+
+@lru_cache(maxsize=None)
+def _load_truetype(font_path: str, size: int) -> ImageFont.FreeTypeFont:
+    """Load a TrueType font once per ``(font_path, size)``.
+
+    Raises whatever ``ImageFont.truetype`` raises for unusable paths; failures
+    are not cached.
+    """
+    return ImageFont.truetype(font_path, size)
+
 
 def get_font(size: int) -> ImageFont.FreeTypeFont:
     """Try to load a scalable TrueType font; fall back to the default font.
 
-    Attempts to load fonts in the following order:
+    Fonts are cached per file and size by :func:`_load_truetype`, so repeated
+    calls from the layout loop do not re-parse the font file.  Attempts to
+    load fonts in the following order:
     1. DejaVuSans-Bold (Linux)
     2. Arial (Windows/macOS)
     3. Helvetica (macOS)
@@ -75,6 +114,9 @@ def get_font(size: int) -> ImageFont.FreeTypeFont:
     Returns:
         A PIL ``ImageFont`` instance.
     """
+    global _FONT_PATH
+    if _FONT_PATH:
+        return _load_truetype(_FONT_PATH, size)
     font_paths = [
         "DejaVuSans-Bold.ttf",  # Linux
         "Arial.ttf",            # Windows/macOS
@@ -86,9 +128,11 @@ def get_font(size: int) -> ImageFont.FreeTypeFont:
     ]
     for font_path in font_paths:
         try:
-            return ImageFont.truetype(font_path, size)
+            font = _load_truetype(font_path, size)
         except Exception:
             continue
+        _FONT_PATH = font_path
+        return font
     # Fallback to the default font (may not be scalable)
     return ImageFont.load_default()
 
@@ -98,8 +142,12 @@ FONT = get_font(FONT_SIZE)
 # Try to load a playful font for headings and cover pages.  If unavailable
 # fallback to the normal body font.  Additional fonts may be added here in
 # priority order to customise the look and feel; the first existing font is
-# chosen.
+# chosen.  Fonts are cached per file and size as the text layout probes many
+# sizes.
 def get_heading_font(size: int) -> ImageFont.ImageFont:
+    global _HEADING_FONT_PATH
+    if _HEADING_FONT_PATH:
+        return _load_truetype(_HEADING_FONT_PATH, size)
     heading_candidates = [
         # Common playful fonts that may be installed on a host system
         "ComicSansMS.ttf",
@@ -108,52 +156,123 @@ def get_heading_font(size: int) -> ImageFont.ImageFont:
     ]
     for font_path in heading_candidates:
         try:
-            return ImageFont.truetype(font_path, size)
+            font = _load_truetype(font_path, size)
         except Exception:
             continue
+        _HEADING_FONT_PATH = font_path
+        return font
     return get_font(size)
 
 
-def wrap_text(text: str, draw: ImageDraw.Draw, font: ImageFont.ImageFont, max_width: float) -> list[str]:
-    """Split text into lines that fit within a specified width.
+def _tokenize(text: str) -> list[list[str]]:
+    """Split text into explicit lines of words; blank lines become ``[]``."""
+    return [line.split() if line.strip() else [] for line in text.split('\n')]
 
-    The function respects explicit newline characters in the input text.
-    Each line is assembled word by word and measured using PIL's
-    ``textbbox`` for accurate sizing.  When the line exceeds ``max_width`` it
-    is committed and a new line is started.
+
+def _greedy_breaks(widths: list[float], space_w: float, max_width: float) -> list[int]:
+    """Return the word indices at which new lines start.
+
+    A plain accumulator over precomputed advance widths: a word that would
+    push the current line past ``max_width`` starts a new line, unless it is
+    the first word on that line.
+    """
+    breaks: list[int] = []
+    line_w = widths[0]
+    for i in range(1, len(widths)):
+        width = widths[i]
+        if line_w + space_w + width > max_width:
+            breaks.append(i)
+            line_w = width
+        else:
+            line_w += space_w + width
+    return breaks
+
+
+def wrap_tokens(tokens: list[list[str]], font: ImageFont.ImageFont, max_width: float) -> list[str]:
+    """Wrap pre‑tokenised lines of words to fit within a specified width.
+
+    Each distinct word and a single space are measured once with
+    ``font.getlength``; :func:`_greedy_breaks` then accumulates those
+    advance widths rather than re-measuring the growing line for every word.
+    When the line would exceed ``max_width`` it is committed and a new line
+    is started.
 
     Args:
-        text: The raw text to wrap.
-        draw: A ``ImageDraw`` instance used for measurement.
+        tokens: Output of :func:`_tokenize`, one list of words per explicit
+            line.
         font: The font in which the text will be rendered.
         max_width: The maximum allowed width in pixels for a single line.
 
     Returns:
         A list of strings representing the wrapped lines.
     """
-    raw_lines = text.split('\n')
     wrapped_lines: list[str] = []
-    for raw_line in raw_lines:
-        if not raw_line.strip():
+    space_w = font.getlength(' ')
+    word_w: dict[str, float] = {}
+    for words in tokens:
+        if not words:
             wrapped_lines.append("")
             continue
-        words = raw_line.split()
-        current = ''
         for word in words:
-            test = f'{current} {word}'.strip()
-            # Use textbbox to measure width
-            bbox = draw.textbbox((0, 0), test, font=font)
-            width = bbox[2] - bbox[0]
-            if width > max_width and current:
-                wrapped_lines.append(current)
-                current = word
-            else:
-                current = test
-        if current:
-            wrapped_lines.append(current)
+            if word not in word_w:
+                word_w[word] = font.getlength(word)
+        breaks = _greedy_breaks([word_w[word] for word in words], space_w, max_width)
+        for start, end in zip([0] + breaks, breaks + [len(words)]):
+            wrapped_lines.append(' '.join(words[start:end]))
     return wrapped_lines
 
 
+def wrap_text(text: str, font: ImageFont.ImageFont, max_width: float) -> list[str]:
+    """Split text into lines that fit within a specified width.
+
+    The function respects explicit newline characters in the input text.
+    See :func:`wrap_tokens` for the wrapping itself; callers wrapping the
+    same text repeatedly should tokenise once and call it directly.
+
+    Args:
+        text: The raw text to wrap.
+        font: The font in which the text will be rendered.
+        max_width: The maximum allowed width in pixels for a single line.
+
+    Returns:
+        A list of strings representing the wrapped lines.
+    """
+    return wrap_tokens(_tokenize(text), font, max_width)
+
+
+@lru_cache(maxsize=64)
+def _font_metrics(size: int) -> tuple[ImageFont.ImageFont, int, int]:
+    """Return ``(font, line_height, spacing)`` for the body text at ``size``.
+
+    These depend only on the font size, so they are measured once per size
+    rather than on every page.  Line height comes from the ``'Ag'`` bounding
+    box for accurate metrics.
+    """
+    font = get_heading_font(size)
+    bbox = font.getbbox('Ag')
+    return font, bbox[3] - bbox[1], int(size * 0.25)
+
+
+@lru_cache(maxsize=None)
+def _panel_page(colour: tuple[int, int, int]) -> Image.Image:
+    """Return a blank text page: a ``colour`` background with the white panel.
+
+    Only a handful of background colours exist and the panel never moves, so
+    each template is built once and callers take a ``copy()`` (a single
+    buffer copy) to draw on.  The cached image must not be modified.
+    """
+    img = Image.new('RGB', PAGE_SIZE, colour)
+    draw = ImageDraw.Draw(img)
+    # Draw the panel.  We intentionally omit the border so the panel blends
+    # softly with the pastel background.  Use rounded_rectangle if
+    # available; fall back to a normal rectangle on older PIL versions.
+    try:
+        draw.rounded_rectangle(PANEL_RECT, radius=40, fill=PANEL_FILL, outline=None)
+    except Exception:
+        draw.rectangle(PANEL_RECT, fill=PANEL_FILL, outline=None)
+    return img
+
+
 def create_text_page(paragraph: str, page_index: int) -> Image.Image:
     """Create a decorated page for a given paragraph.
 
@@ -172,97 +291,187 @@ def create_text_page(paragraph: str, page_index: int) -> Image.Image:
     Returns:
         An ``Image`` object representing the fully laid out page.
     """
-    # Pick a pastel background colour using round‑robin selection
-    bg_colour = BACKGROUND_COLOURS[page_index % len(BACKGROUND_COLOURS)]
-    img = Image.new('RGB', (int(PAGE_SIZE[0]), int(PAGE_SIZE[1])), bg_colour)
-    draw = ImageDraw.Draw(img)
-    # Define an inner panel for the text with rounded corners.  This panel
-    # separates the content from the background and improves readability.
-    panel_rect = (
-        MARGIN,
-        MARGIN,
-        PAGE_SIZE[0] - MARGIN,
-        PAGE_SIZE[1] - MARGIN,  # no extra space needed since page numbers are removed
-    )
-    # Draw the panel.  We intentionally omit the border so the panel blends
-    # softly with the pastel background.  Use rounded_rectangle if
-    # available; fall back to a normal rectangle on older PIL versions.
-    try:
-        draw.rounded_rectangle(panel_rect, radius=40, fill=PANEL_FILL, outline=None)
-    except Exception:
-        draw.rectangle(panel_rect, fill=PANEL_FILL, outline=None)
-
-
-    # Determine the maximum width for text inside the panel
-    max_width = panel_rect[2] - panel_rect[0] - 2 * 40  # internal padding
+    panel_rect = PANEL_RECT
+    max_width = TEXT_MAX_WIDTH
     # Start with the preferred font size and reduce as necessary. ``MIN_FONT_SIZE``
     # represents the smallest acceptable text size on the high‑resolution
     # pages.
     min_font_size = MIN_FONT_SIZE
-    font_size = FONT_SIZE
-    # Temporary drawing context used for measuring text.  We'll reuse 'draw'.
+    max_height = TEXT_MAX_HEIGHT
     # Use a playful heading font throughout the text to make it feel more
     # child‑friendly.  If the desired font is unavailable the helper
-    # gracefully falls back to a standard font.
-    while font_size >= min_font_size:
-        font = get_heading_font(font_size)
-        lines = wrap_text(paragraph, draw, font, max_width)
-        # Compute line height via textbbox for accurate metrics
-        bbox = font.getbbox('Ag')
-        line_height = bbox[3] - bbox[1]
-        spacing = int(font_size * 0.25)
-        total_height = line_height * len(lines) + spacing * (len(lines) - 1)
-        if total_height <= (panel_rect[3] - panel_rect[1]) - 2 * 40:
-            break
-        font_size -= 2
-    else:
-        font = get_heading_font(min_font_size)
-        lines = wrap_text(paragraph, draw, font, max_width)
-        bbox = font.getbbox('Ag')
-        line_height = bbox[3] - bbox[1]
-        spacing = int(min_font_size * 0.25)
-        total_height = line_height * len(lines) + spacing * (len(lines) - 1)
+    # gracefully falls back to a standard font.  Layouts are memoised per
+    # size so the search never wraps the paragraph twice at the same size.
+    tokens = _tokenize(paragraph)
+    layouts: dict[int, tuple] = {}
+
+    def layout(size: int) -> tuple:
+        if size not in layouts:
+            font, line_height, spacing = _font_metrics(size)
+            lines = wrap_tokens(tokens, font, max_width)
+            total_height = line_height * len(lines) + spacing * (len(lines) - 1)
+            layouts[size] = (font, lines, line_height, spacing, total_height)
+        return layouts[size]
+
+    # Candidate sizes step down by 2 from ``FONT_SIZE`` to ``min_font_size``.
+    # The wrapped height only grows with the font size, so bisect for the
+    # largest candidate that fits instead of trying every size in turn.
+    candidates = list(range(FONT_SIZE, min_font_size - 1, -2))
+    lo, hi = 0, len(candidates)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if layout(candidates[mid])[4] <= max_height:
+            hi = mid
+        else:
+            lo = mid + 1
+    font_size = candidates[lo] if lo < len(candidates) else min_font_size
+    font, lines, line_height, spacing, total_height = layout(font_size)
+    # The layout is measured from the fonts alone; only now build the page.
+    # Pick a pastel background colour using round‑robin selection
+    bg_colour = BACKGROUND_COLOURS[page_index % len(BACKGROUND_COLOURS)]
+    img = _panel_page(bg_colour).copy()
+    draw = ImageDraw.Draw(img)
+    # Lines are centred horizontally within the panel
+    centre_x = (panel_rect[0] + panel_rect[2]) / 2
     # Compute initial y coordinate to vertically centre content within the panel
     y = panel_rect[1] + ((panel_rect[3] - panel_rect[1]) - total_height) // 2
-    # Draw each line onto the panel.  To make the text pop, draw a subtle
-    # shadow behind each line before the primary text.  The shadow colour is
-    # a mid‑grey that contrasts gently against the white panel without
-    # overpowering the main text.  Lines containing only whitespace are
-    # handled separately to preserve vertical spacing.
+    # Draw each line onto the panel.  Each line is rasterised exactly once;
+    # empty lines only advance ``y`` to preserve vertical spacing.
     for line in lines:
         if line == "":
             y += line_height + spacing
             continue
-        # Use textbbox to compute width accurately
-        text_bbox = draw.textbbox((0, 0), line, font=font)
-        w = text_bbox[2] - text_bbox[0]
-        # Centre the text within the panel with a 40px horizontal padding
-        x = panel_rect[0] + (max_width - w) // 2 + 40
-        # Only draw the primary text (no shadow)
-        draw.text((x, y), line, font=font, fill=TEXT_COLOUR)
+        # The ``"ma"`` anchor centres the line horizontally on ``centre_x``
+        # while keeping ``y`` as the ascender line, so no separate width
+        # measurement is needed.
+        draw.text((centre_x, y), line, font=font, fill=TEXT_COLOUR, anchor='ma')
         y += line_height + spacing
     # Page numbers removed for children's books - cleaner design for KDP
     return img
 
 
-def centre_crop_image(img: Image.Image) -> Image.Image:
-    """Resize and crop an image to fill the square page while preserving aspect ratio.
+def centre_crop_image(img: Image.Image, size: tuple[int, int] = PAGE_SIZE) -> Image.Image:
+    """Resize and crop an image to fill the page while preserving aspect ratio.
 
-    The image is resized so that at least one dimension matches the page size,
-    then the surplus in the other dimension is centre-cropped away.
+    The image is resized so that at least one dimension matches the target
+    size, then the surplus in the other dimension is centre-cropped away.
 
     Args:
         img: A PIL ``Image`` instance.
+        size: Target ``(width, height)``; defaults to the interior page size.
+
+    Returns:
+        A new ``Image`` object of exactly ``size``.
+    """
+    # Work out the centred crop in source pixels first so LANCZOS only
+    # processes pixels that survive onto the page.  The box keeps
+    # floating‑point coordinates, which avoids tiny rounding errors that can
+    # leave stray borders.  ``reducing_gap`` pre-shrinks large sources with a
+    # cheap box filter before the final LANCZOS pass.  The resulting image is
+    # guaranteed to match ``size`` exactly.
+    width, height = img.size
+    page_ratio = size[0] / size[1]
+    if width / height > page_ratio:
+        crop_width = height * page_ratio
+        box = ((width - crop_width) / 2, 0, (width + crop_width) / 2, height)
+    else:
+        crop_height = width / page_ratio
+        box = (0, (height - crop_height) / 2, width, (height + crop_height) / 2)
+    # Sources already at page scale only need the surplus trimmed; a plain
+    # pixel-aligned crop avoids resampling altogether.
+    if (box[2] - box[0], box[3] - box[1]) == size and all(float(c).is_integer() for c in box):
+        return img.crop(tuple(int(c) for c in box))
+    return img.resize(size, Image.Resampling.LANCZOS, box=box, reducing_gap=3.0)
+
+
+def _open_rgb(img: Union[str, Image.Image]) -> Image.Image:
+    """Open an image for resampling to the page size, decoded as RGB.
+
+    ``draft`` lets libjpeg decode large JPEGs at a reduced scale (1/2, 1/4
+    or 1/8), skipping IDCT work for pixels LANCZOS would discard anyway; it
+    is a no-op for other formats.  The target is twice the page size so the
+    final LANCZOS pass still has detail to filter from.  Images that already
+    decode to RGB are not converted again.
+
+    Args:
+        img: A path, or an image returned by ``Image.open`` that has not been
+            loaded yet.
+    """
+    if isinstance(img, str):
+        img = Image.open(img)
+    img.draft('RGB', (PAGE_SIZE[0] * 2, PAGE_SIZE[1] * 2))
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+    return img
+
+
+def _encode_jpeg(img: Image.Image) -> bytes:
+    """Encode a rendered page as JPEG bytes for embedding in the manuscript."""
+    buf = io.BytesIO()
+    img.save(buf, 'JPEG', quality=JPEG_QUALITY)
+    return buf.getvalue()
+
+
+def _render_illustration(img_path: str) -> bytes:
+    """Load an illustration and centre‑crop it to the page size.
+
+    JPEGs that already match the page size are returned byte for byte so the
+    PDF embeds them without a decode/encode round trip.  Kept at module level
+    so it can be dispatched to worker processes.
+
+    Returns:
+        JPEG bytes for the illustration page.
+    """
+    with Image.open(img_path) as img:  # reads the header only
+        if img.format == 'JPEG' and img.mode == 'RGB' and img.size == PAGE_SIZE:
+            with open(img_path, 'rb') as f:
+                return f.read()
+        return _encode_jpeg(centre_crop_image(_open_rgb(img)))
+
+
+def _render_text_page(paragraph: str, page_index: int, cache_dir: Union[str, None] = None) -> bytes:
+    """Render a text page with :func:`create_text_page` and encode it as JPEG.
+
+    When ``cache_dir`` is given, the encoded page is stored there under a
+    hash of everything that affects its pixels, so re-running a book with
+    unchanged text skips text page rendering entirely.
 
     Returns:
-        A new ``Image`` object of size ``PAGE_SIZE``.
+        JPEG bytes for the text page.
     """
-    # ``ImageOps.fit`` handles the scaling and cropping in one step using
-    # floating‑point math internally, which avoids tiny rounding errors that can
-    # leave stray borders.  The resulting image is guaranteed to match
-    # ``PAGE_SIZE`` exactly.
-    size = (int(round(PAGE_SIZE[0])), int(round(PAGE_SIZE[1])))
-    return ImageOps.fit(img, size, Image.Resampling.LANCZOS, centering=(0.5, 0.5))
+    if cache_dir is None:
+        return _encode_jpeg(create_text_page(paragraph, page_index))
+    bg_colour = BACKGROUND_COLOURS[page_index % len(BACKGROUND_COLOURS)]
+    # The font fallback chain can resolve differently on another machine
+    # while every constant stays the same, so the chosen file is part of
+    # the key too.
+    get_heading_font(FONT_SIZE)
+    font_path = _HEADING_FONT_PATH or _FONT_PATH or 'default'
+    key = hashlib.sha1(
+        f"{TEXT_CACHE_VERSION}|{PAGE_SIZE}|{FONT_SIZE}|{MIN_FONT_SIZE}|{font_path}|{bg_colour}|{JPEG_QUALITY}|{paragraph}".encode('utf-8')
+    ).hexdigest()
+    path = os.path.join(cache_dir, f'{key}.jpg')
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except OSError:
+        pass
+    data = _encode_jpeg(create_text_page(paragraph, page_index))
+    # The cache is only an optimisation: a read-only or full books folder
+    # must not fail the build, so write errors are ignored.
+    # Write then rename so a concurrent reader never sees a partial file
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+    return data
 
 
 def get_title_from_name(book_name: str) -> str:
@@ -289,10 +498,10 @@ def get_title_from_name(book_name: str) -> str:
     return ''.join(spaced)
 
 
-def create_cover_page(cover_img: Image.Image, title: str) -> Image.Image:
+def create_cover_page(cover_img: Image.Image, title: str, size: tuple[int, int] = PAGE_SIZE) -> Image.Image:
     """Prepare the front cover image without adding any text.
 
-    The image is centre‑cropped to the page size so that it fills the
+    The image is centre‑cropped to ``size`` so that it fills the
     bleed area on all sides.  No additional title overlay is applied
     because many cover designs already include the book title within
     the artwork.
@@ -300,13 +509,14 @@ def create_cover_page(cover_img: Image.Image, title: str) -> Image.Image:
     Args:
         cover_img: Source PIL image for the cover.
         title: Full book title to render on the front cover.
+        size: Target ``(width, height)``; defaults to the interior page size.
 
     Returns:
         A PIL ``Image`` representing the decorated cover page.
     """
     # Simply centre‑crop the provided image and return it. The caller is
     # responsible for adding any spine text when needed.
-    return centre_crop_image(cover_img)
+    return centre_crop_image(cover_img, size)
 
 
 # KDP-required cover size for 8.5 x 8.5 in book (with bleed):
@@ -317,10 +527,111 @@ COVER_SIZE = (
     int(round(COVER_WIDTH_INCHES * DPI)),
     int(round(COVER_HEIGHT_INCHES * DPI)),
 )
+# Spine title text size, used once a book is thick enough for spine text.
+SPINE_FONT_SIZE = int(INCH * 0.2)  # ~60px at 300 dpi
 
 
-def generate_book(book_name: str, *, output_dir: Union[str, None] = None, skip_cover: bool = False) -> None:
-    """Generate the picture book PDF for a given book folder."""
+def _iter_interior_pages(
+    executor: Executor,
+    paragraphs: list[str],
+    image_paths: list[str],
+    cache_dir: Union[str, None] = None,
+) -> Iterator[bytes]:
+    """Submit the manuscript pages to ``executor`` and iterate them in order.
+
+    Each paragraph contributes an illustration page followed by its text
+    page.  Pages are independent and CPU-bound (JPEG decoding, LANCZOS
+    resampling and text rasterisation), so they are rendered by the pool.
+    All work is submitted immediately; ``map`` keeps the results in
+    submission order.  Text page indices start at 2 because each one follows
+    its illustration.
+
+    Args:
+        executor: Pool used to render the pages.
+        paragraphs: Story text, one paragraph per spread.
+        image_paths: Illustration paths matching ``paragraphs``.
+        cache_dir: Optional directory for cached text pages.
+
+    Returns:
+        An iterator over JPEG‑encoded pages, illustration then text page.
+    """
+    illustrations = executor.map(_render_illustration, image_paths)
+    text_pages = executor.map(
+        _render_text_page,
+        paragraphs,
+        [2 * idx + 2 for idx in range(len(paragraphs))],
+        [cache_dir] * len(paragraphs),
+    )
+    return (page for spread in zip(illustrations, text_pages) for page in spread)
+
+
+def save_cover_spread(
+    cover_path: str, back_cover_path: Union[str, None], title: str, page_count: int, cover_pdf: str
+) -> None:
+    """Compose the KDP cover spread (back, spine, front) and save it as a PDF.
+
+    Args:
+        cover_path: Front cover illustration.
+        back_cover_path: Back cover illustration, or ``None`` to leave the
+            back of the spread blank.
+        title: Book title, printed on the spine of thick books.
+        page_count: Number of interior pages, used to size the spine.
+        cover_pdf: Destination PDF path.
+    """
+    # --- KDP COVER SPREAD ---
+    # Create a blank cover spread at KDP-required size
+    cover_spread = Image.new('RGB', COVER_SIZE, (255, 255, 255))
+    half_width = COVER_SIZE[0] // 2
+    height = COVER_SIZE[1]
+    # Resize and centre crop the source images straight to each half of the
+    # spread, so the artwork extends into the bleed area after a single
+    # resample rather than going through the interior page size first.
+    half_size = (half_width, height)
+    cover_resized = create_cover_page(_open_rgb(cover_path), title, half_size)
+    # Place the back cover on the left and the front cover on the right.
+    # Without a back cover the left half stays blank.
+    if back_cover_path is not None:
+        cover_spread.paste(centre_crop_image(_open_rgb(back_cover_path), half_size), (0, 0))
+    cover_spread.paste(cover_resized, (half_width, 0))
+
+    # Add spine text if the book is thick enough
+    if page_count >= 100:
+        spine_width_in = 0.002252 * page_count
+        spine_w = int(spine_width_in * DPI)
+        spine_x = half_width - spine_w // 2
+        font = get_heading_font(SPINE_FONT_SIZE)
+        text = title
+        # Render the title as a coverage mask only the size of the spine and
+        # paste black through it, rather than compositing a full-spread RGBA
+        # layer for a strip of text.
+        text_mask = Image.new("L", (spine_w, height), 0)
+        tdraw = ImageDraw.Draw(text_mask)
+        text_bbox = tdraw.textbbox((0, 0), text, font=font)
+        tw = text_bbox[2] - text_bbox[0]
+        th = text_bbox[3] - text_bbox[1]
+        tx = (spine_w - tw) // 2
+        ty = (height - th) // 2
+        tdraw.text((tx, ty), text, font=font, fill=255)
+        rotated = text_mask.rotate(90, expand=True)
+        cover_spread.paste((0, 0, 0), (spine_x, 0), rotated)
+    # Save the cover spread as a PDF.  Pillow embeds RGB images as JPEG; use
+    # the same explicit quality as the manuscript pages.
+    cover_spread.save(cover_pdf, "PDF", resolution=300.0, quality=JPEG_QUALITY)
+    print(f'Cover PDF generated at {cover_pdf}')
+
+
+def generate_book(
+    book_name: str,
+    *,
+    output_dir: Union[str, None] = None,
+    skip_cover: bool = False,
+    executor: Union[Executor, None] = None,
+) -> None:
+    """Generate the picture book PDF for a given book folder.
+
+    Pages are rendered on ``executor`` when given, so several books can share
+    one pool of workers; otherwise a process pool is created for this book.
+    """
     book_path = os.path.join(BOOKS_DIR, book_name)
     images_path = os.path.join(book_path, 'images')
     text_path = os.path.join(book_path, 'book_text.txt')
@@ -338,91 +649,60 @@ def generate_book(book_name: str, *, output_dir: Union[str, None] = None, skip_c
     with open(text_path, 'r', encoding='utf-8') as f:
         content = f.read()
     paragraphs = [p.strip() for p in content.split('\n\n') if p.strip()]
-    # Prepare list of image paths: cover plus one per paragraph
-    image_files: list[str] = [os.path.join(images_path, 'cover.jpg')]
-    for i in range(1, len(paragraphs) + 1):
-        image_files.append(os.path.join(images_path, f'page{i}.jpg'))
-    # --- COVER & BACK COVER HANDLING ---
-    # Load cover and back cover images if they exist
+    # Prepare list of image names: cover plus one per paragraph
+    image_names = ['cover.jpg'] + [f'page{i}.jpg' for i in range(1, len(paragraphs) + 1)]
+    image_files = [os.path.join(images_path, name) for name in image_names]
+    # List the images folder once rather than checking each file separately
+    try:
+        with os.scandir(images_path) as entries:
+            available = {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        available = set()
     title = get_title_from_name(book_name)
-    if not skip_cover:
-        if os.path.exists(image_files[0]):
-            cover_page = create_cover_page(Image.open(image_files[0]).convert("RGB"), title)
-        else:
-            print(f"[SKIP] No cover.jpg found for {book_name}")
-            return
-        back_cover_path = os.path.join(images_path, 'back.jpg')
-        if os.path.exists(back_cover_path):
-            back_page = centre_crop_image(Image.open(back_cover_path).convert('RGB'))
-        else:
-            # If no back cover, use a blank page
-            back_page = Image.new('RGB', (int(PAGE_SIZE[0]), int(PAGE_SIZE[1])), (255, 255, 255))
-        # --- KDP COVER SPREAD ---
-        # Create a blank cover spread at KDP-required size
-        cover_spread = Image.new('RGB', COVER_SIZE, (255, 255, 255))
-        half_width = COVER_SIZE[0] // 2
-        height = COVER_SIZE[1]
-        # Resize and centre crop images so they completely fill each half of the
-        # spread.  This ensures the artwork extends into the bleed area.
-        def fill_crop(img, target_w, target_h):
-            """Resize and crop an image so it completely fills ``target_w``×``target_h``."""
-            size = (int(target_w), int(target_h))
-            return ImageOps.fit(img, size, Image.Resampling.LANCZOS, centering=(0.5, 0.5))
-
-        back_resized = fill_crop(back_page, half_width, height)
-        cover_resized = fill_crop(cover_page, half_width, height)
-        # Place the back cover on the left and the front cover on the right
-        cover_spread.paste(back_resized, (0, 0))
-        cover_spread.paste(cover_resized, (half_width, 0))
-
-        # Add spine text if the book is thick enough
-        page_count = len(paragraphs) * 2
-        if page_count >= 100:
-            spine_width_in = 0.002252 * page_count
-            spine_w = int(spine_width_in * DPI)
-            spine_x = half_width - spine_w // 2
-            spine = Image.new("RGBA", cover_spread.size, (0, 0, 0, 0))
-            font = get_heading_font(int(INCH * 0.2))
-            text = title
-            text_img = Image.new("RGBA", (spine_w, height), (0, 0, 0, 0))
-            tdraw = ImageDraw.Draw(text_img)
-            text_bbox = tdraw.textbbox((0, 0), text, font=font)
-            tw = text_bbox[2] - text_bbox[0]
-            th = text_bbox[3] - text_bbox[1]
-            tx = (spine_w - tw) // 2
-            ty = (height - th) // 2
-            tdraw.text((tx, ty), text, font=font, fill=(0, 0, 0, 255))
-            rotated = text_img.rotate(90, expand=True)
-            spine.paste(rotated, (spine_x, 0), rotated)
-            cover_spread = Image.alpha_composite(cover_spread.convert("RGBA"), spine).convert("RGB")
-        # Save the cover spread as a PDF
-        cover_spread.save(cover_pdf, "PDF", resolution=300.0)
-        print(f'Cover PDF generated at {cover_pdf}')
-    # --- INTERIOR PAGES (MANUSCRIPT) ---
-    pages: list[Image.Image] = []
-    # Create pages for each paragraph (illustration + text)
-    for idx, paragraph in enumerate(paragraphs):
-        img_path = image_files[idx + 1]
-        if not os.path.exists(img_path):
-            print(f"[SKIP] No image for page {idx+1} in {book_name}")
+    if not skip_cover and image_names[0] not in available:
+        print(f"[SKIP] No cover.jpg found for {book_name}")
+        return
+    # Every illustration must exist before any interior rendering is started
+    missing_page = next(
+        (idx for idx in range(len(paragraphs)) if image_names[idx + 1] not in available),
+        None,
+    )
+    if executor is None:
+        pool_context = ProcessPoolExecutor(max_workers=os.cpu_count())
+    else:
+        pool_context = nullcontext(executor)
+    with pool_context as executor:
+        # Submit the interior pages first so their JPEG decoding and
+        # resampling overlap with the cover spread built on this process.
+        if missing_page is None:
+            text_cache = os.path.join(book_path, TEXT_CACHE_DIR)
+            pages = _iter_interior_pages(executor, paragraphs, image_files[1:], text_cache)
+        # --- COVER & BACK COVER HANDLING ---
+        if not skip_cover:
+            # ``available`` already says whether there is a back cover
+            back_cover_path = os.path.join(images_path, 'back.jpg') if 'back.jpg' in available else None
+            save_cover_spread(image_files[0], back_cover_path, title, len(paragraphs) * 2, cover_pdf)
+        # --- INTERIOR PAGES (MANUSCRIPT) ---
+        if missing_page is not None:
+            print(f"[SKIP] No image for page {missing_page+1} in {book_name}")
             return
-        img = Image.open(img_path).convert('RGB')
-        # Determine the page index for the illustration page
-        page_idx = len(pages) + 1  # +1 because cover is not included
-        # Centre crop the illustration
-        pages.append(centre_crop_image(img))
-        # Now create the corresponding text page.  Its index will be the
-        # current length of pages (image was just appended) + 1
-        page_idx = len(pages) + 1
-        pages.append(create_text_page(paragraph, page_idx))
-    # Save the manuscript PDF (interior pages only)
-    if pages:
-        pages[0].save(
-            output_pdf,
-            save_all=True,
-            append_images=pages[1:],
-            resolution=300.0,
-        )
+        # Save the manuscript PDF (interior pages only).  Pages arrive as
+        # JPEG bytes, which img2pdf embeds verbatim (DCTDecode) instead of
+        # re-encoding them, so only compressed pages are held in memory.
+        page_data = list(pages)
+        page_count = len(page_data)
+        if page_count:
+            with open(output_pdf, 'wb') as f:
+                img2pdf.convert(
+                    page_data,
+                    layout_fun=img2pdf.get_fixed_dpi_layout_fun((INCH, INCH)),
+                    # Pages passed through byte for byte keep their EXIF
+                    # orientation; ignore it like the re-encoded pages do so
+                    # no page turns landscape.
+                    rotation=img2pdf.Rotation.none,
+                    outputstream=f,
+                )
+    if page_count:
         print(f'Manuscript PDF generated at {output_pdf}')
     else:
         print(f"[SKIP] No interior pages generated for {book_name}")
@@ -457,9 +737,18 @@ def main() -> None:
             if os.path.isdir(os.path.join(BOOKS_DIR, d))
         ]
 
-    for book_name in book_names:
-        print(f"Generating book for: {book_name}")
-        generate_book(book_name, output_dir=args.output_dir, skip_cover=args.skip_cover)
+    # Pillow-SIMD builds report a ``.postN`` version suffix
+    print(f"Using Pillow {PIL_VERSION}")
+    # One pool serves every book so worker start-up is paid only once
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for book_name in book_names:
+            print(f"Generating book for: {book_name}")
+            generate_book(
+                book_name,
+                output_dir=args.output_dir,
+                skip_cover=args.skip_cover,
+                executor=executor,
+            )
 
 if __name__ == "__main__":
     main()
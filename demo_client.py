@@ -1,6 +1,8 @@
 import base64
 import io
+import json
 import re
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFont
 
 
@@ -40,36 +42,55 @@ def _demo_story_from_prompt(prompt_text: str) -> str:
     return "\n\n".join([f"This is demo text for page {i}." for i in range(1, pages + 1)])
 
 
-def _demo_image_b64(prompt_text: str) -> str:
-    """Create a simple placeholder JPEG and return as base64 string."""
-    img = Image.new("RGB", (1024, 1024), color=(240, 240, 240))
-    d = ImageDraw.Draw(img)
-    try:
-        font = ImageFont.truetype("arial.ttf", 48)
-    except Exception:
-        font = ImageFont.load_default()
-    title = "DEMO IMAGE"
-    d.text((40, 40), title, fill=(0, 0, 0), font=font)
-    snippet = (prompt_text or "").strip().replace("\n", " ")[:80]
+def _load_demo_font(size: int) -> ImageFont.ImageFont:
     try:
-        small_font = ImageFont.truetype("arial.ttf", 16)
+        return ImageFont.truetype("arial.ttf", size)
     except Exception:
-        small_font = ImageFont.load_default()
-    d.text((40, 110), snippet, fill=(0, 0, 0), font=small_font)
+        return ImageFont.load_default()
+
+
+def _build_demo_background() -> Image.Image:
+    """Draw the shared placeholder background with its "DEMO IMAGE" title."""
+    img = Image.new("RGB", (1024, 1024), color=(240, 240, 240))
+    d = ImageDraw.Draw(img)
+    d.text((40, 40), "DEMO IMAGE", fill=(0, 0, 0), font=_load_demo_font(48))
+    return img
+
+
+# Built once; every placeholder only adds its prompt snippet on a copy.
+_DEMO_BG = _build_demo_background()
+_SNIPPET_FONT = _load_demo_font(16)
+
+
+@lru_cache(maxsize=128)
+def _demo_snippet_b64(snippet: str) -> str:
+    img = _DEMO_BG.copy()
+    ImageDraw.Draw(img).text((40, 110), snippet, fill=(0, 0, 0), font=_SNIPPET_FONT)
     buf = io.BytesIO()
     img.save(buf, format="JPEG", quality=70)
-    buf.seek(0)
-    return base64.b64encode(buf.read()).decode("ascii")
+    return base64.b64encode(buf.getvalue()).decode("ascii")
+
+
+def _demo_image_b64(prompt_text: str) -> str:
+    """Create a simple placeholder JPEG and return as base64 string.
+
+    Only the first 80 characters of the prompt appear on the image, so
+    results are cached by that snippet.
+    """
+    snippet = (prompt_text or "").strip().replace("\n", " ")[:80]
+    return _demo_snippet_b64(snippet)
 
 
 class DemoChatCompletions:
-    def create(self, model: str, messages: list):
+    def create(self, model: str, messages: list, response_format: dict = None):
         last_user = ""
         for m in reversed(messages):
             if m.get("role") == "user":
                 last_user = m.get("content", "")
                 break
         content = _demo_story_from_prompt(last_user)
+        if response_format:
+            content = json.dumps({"pages": content.split("\n\n")})
         return DemoChatResponse(content)
 
 
@@ -1,4 +1,6 @@
 import argparse
+import json
+import re
 from pathlib import Path
 from typing import Optional
 import httpx
@@ -9,6 +11,7 @@ from build_book import generate_book as build_pdf
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from prompts import (
     make_story_prompt,
+    make_story_response_format,
     make_cover_prompt,
     make_back_cover_prompt,
     make_title_page_prompt,
@@ -17,26 +20,37 @@ from prompts import (
 
 from demo_client import DemoOpenAI
 
+# build_book.py splits book_text.txt on blank lines, so a blank line inside a
+# page would turn it into two pages on disk.
+_BLANK_LINES = re.compile(r"\n\s*\n")
+
 def generate_image(
     prompt: str,
     out_path: Path,
     client: OpenAI,
     reference_image: Optional[Path] = None,
     image_model: str = "gpt-image-1",
+    reference_bytes: Optional[bytes] = None,
 ) -> None:
-    """Generate an image using gpt-image-1, falling back to a placeholder."""
+    """Generate an image using gpt-image-1, falling back to a placeholder.
+
+    Pass ``reference_bytes`` when the same reference is used for many calls
+    so it is read from disk once; ``reference_image`` then only names it.
+    """
 
     try:
-        if reference_image and reference_image.exists():
-            with reference_image.open("rb") as rf:
-                resp = client.images.edit(
-                    image=rf,
-                    prompt=prompt,
-                    model=image_model,
-                    output_format="jpeg",
-                    input_fidelity="high",
-                    user="picture-book-generator",
-                )
+        if reference_bytes is None and reference_image and reference_image.exists():
+            reference_bytes = reference_image.read_bytes()
+        if reference_bytes is not None:
+            name = reference_image.name if reference_image else "reference.jpg"
+            resp = client.images.edit(
+                image=(name, reference_bytes),
+                prompt=prompt,
+                model=image_model,
+                output_format="jpeg",
+                input_fidelity="high",
+                user="picture-book-generator",
+            )
         else:
             resp = client.images.generate(
                 prompt=prompt,
@@ -51,10 +65,29 @@ def generate_image(
         print(f"Image generation failed: {exc}.")
         raise SystemExit(1)
 
-def chat_completion(messages, client, model: str = "gpt-4.1"):
+def _make_http_client(max_connections: int) -> httpx.Client:
+    """Return the HTTP client shared by every API call in a run.
+
+    HTTP/2 multiplexes the concurrent image uploads over one TLS connection,
+    and the long read timeout covers slow image generations.
+    """
+    return httpx.Client(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=60,
+        ),
+        timeout=httpx.Timeout(600.0, connect=10.0),
+    )
+
+
+def chat_completion(messages, client, model: str = "gpt-4.1", response_format: Optional[dict] = None):
+    extra = {"response_format": response_format} if response_format else {}
     response = client.chat.completions.create(
         model=model,
         messages=messages,
+        **extra,
     )
     return response.choices[0].message.content.strip()
 
@@ -70,6 +103,7 @@ def main(
     api_key: Optional[str] = None,
     text_model: str = "gpt-4.1",
     image_model: str = "gpt-image-1",
+    concurrency: int = 8,
 ) -> None:
     print("\n========== Picture Book Generator ==========")
     if demo:
@@ -89,6 +123,8 @@ def main(
         raise SystemExit("Missing required arguments: " + ", ".join(missing))
     if int(pages) < 12:
         raise SystemExit("--pages must be at least 12")
+    if concurrency < 1:
+        raise SystemExit("--concurrency must be at least 1")
 
     info = {
         "title": title,
@@ -111,7 +147,15 @@ def main(
     else:
         if not api_key:
             raise SystemExit("Missing --api-key (required unless running with --demo).")
-        client = OpenAI(api_key=api_key.strip(), http_client=httpx.Client())
+        # The SDK retries rate limits, 5xx responses and dropped connections
+        # with jittered exponential backoff, honouring Retry-After.  Allow
+        # more attempts than its default of two so a burst of 429s during the
+        # image fan-out does not abort the whole book.
+        client = OpenAI(
+            api_key=api_key.strip(),
+            http_client=_make_http_client(concurrency),
+            max_retries=6,
+        )
 
     # Start persistent chat
     messages = [
@@ -122,20 +166,33 @@ def main(
     print("\n[1/7] Generating story text...")
     # Generate story text and confirm acceptance interactively once
     story_prompt = make_story_prompt(info)
+    # Structured output pins the reply to exactly one paragraph per page, so
+    # the retry below is only a safeguard.
+    story_format = make_story_response_format(info)
     print("="*50)
     print("GENERATED STORY PROMPT:")
     print("="*50)
     print(story_prompt)
     print("="*50)
 
+    # Ask once and resend the same conversation on retries, so the request
+    # does not grow with each attempt and its prefix stays cacheable.
+    messages.append({"role": "user", "content": story_prompt})
     attempt = 1
     while True:
-        messages.append({"role": "user", "content": story_prompt})
-        story_text = chat_completion(messages, client, model=text_model)
-        pages = [p.strip() for p in story_text.split("\n\n") if p.strip()]
-        if len(pages) == info['pages']:
+        reply = chat_completion(messages, client, model=text_model, response_format=story_format)
+        try:
+            pages = [_BLANK_LINES.sub("\n", p.strip()) for p in json.loads(reply)["pages"] if p.strip()]
+        except (json.JSONDecodeError, KeyError, TypeError, AttributeError):
+            print("\nError: Generated story was not the expected JSON. Regenerating...")
+            attempt += 1
+            continue
+        story_text = "\n\n".join(pages)
+        # Count the pages the way build_book.py will read them back
+        saved_pages = [p.strip() for p in story_text.split("\n\n") if p.strip()]
+        if len(saved_pages) == info['pages']:
             break
-        print(f"\nError: Generated story has {len(pages)} pages, but {info['pages']} were requested. Regenerating...")
+        print(f"\nError: Generated story has {len(saved_pages)} pages, but {info['pages']} were requested. Regenerating...")
         attempt += 1
 
     # Display the generated story
@@ -154,7 +211,7 @@ def main(
         raise SystemExit(1)
 
     # Save the accepted story
-    (book_dir / "book_text.txt").write_text("\n\n".join(pages), encoding="utf-8")
+    (book_dir / "book_text.txt").write_text(story_text, encoding="utf-8")
 
     # Handle cover image generation
     cover_path = img_dir / "cover.jpg"
@@ -167,7 +224,9 @@ def main(
     back_cover_path = img_dir / "back.jpg"
     title_page_path = img_dir / "page1.jpg"
     print("[3/7] Generating images (title, back cover, and story pages)...")
-    max_workers = min(8, (len(pages) if pages else 0) + 2)
+    # Every remaining image uses the cover as its reference; read it once
+    cover_bytes = cover_path.read_bytes()
+    max_workers = min(concurrency, (len(pages) if pages else 0) + 2)
     if max_workers <= 0:
         print("    No pages to illustrate.")
     else:
@@ -177,7 +236,7 @@ def main(
             print("    Generating title page image...")
             title_page_prompt = make_title_page_prompt(info)
             fut_title = executor.submit(
-                generate_image, title_page_prompt, title_page_path, client, cover_path, image_model
+                generate_image, title_page_prompt, title_page_path, client, cover_path, image_model, cover_bytes
             )
             futures[fut_title] = ("title", None)
 
@@ -185,7 +244,7 @@ def main(
             print("    Generating back cover image...")
             back_cover_prompt = make_back_cover_prompt(info)
             fut_back = executor.submit(
-                generate_image, back_cover_prompt, back_cover_path, client, cover_path, image_model
+                generate_image, back_cover_prompt, back_cover_path, client, cover_path, image_model, cover_bytes
             )
             futures[fut_back] = ("back", None)
 
@@ -194,7 +253,9 @@ def main(
                 print(f"    Generating page {i+1} image...")
                 page_prompt = make_page_prompt(info, i, page_text)
                 out_path = img_dir / f"page{i+1}.jpg"
-                fut = executor.submit(generate_image, page_prompt, out_path, client, cover_path, image_model)
+                fut = executor.submit(
+                    generate_image, page_prompt, out_path, client, cover_path, image_model, cover_bytes
+                )
                 futures[fut] = ("page", i)
 
             # Handle completions
@@ -284,6 +345,16 @@ if __name__ == "__main__":
         ),
     )
 
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help=(
+            "Maximum number of image requests in flight at once (default: 8). "
+            "Raise it if your OpenAI rate limits allow."
+        ),
+    )
+
     args = parser.parse_args()
 
     ref_img = args.cover_reference
@@ -306,4 +377,5 @@ if __name__ == "__main__":
         api_key=args.api_key,
         text_model=args.text_model,
         image_model=args.image_model,
+        concurrency=args.concurrency,
     )
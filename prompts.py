@@ -7,15 +7,39 @@ def make_story_prompt(info: Dict) -> str:
         f"The title is '{info['title']}'. "
         f"It is about {info['topic']}. "
         f"The style should be {info['book_type']}. "
-        f"Output exactly {info['pages']} paragraphs, one for each page, in order. "
+        f"Return the story as a JSON object whose \"pages\" array holds exactly {info['pages']} strings, one per page, in order. "
+        f"Each string is a single paragraph with no blank lines inside it. "
         f"Do not include any page numbers, headers, or extra text. "
-        f"Separate each paragraph with a single blank line. "
-        f"The output should be ready to save to a text file, with each page's text as a paragraph separated by a blank line."
         f"Please spend your time on generating the story and confirm you are meeting the requirements. "
         f"please use simple words and sentences appropriate for a 3 year old and use simple punctuation."
     )
 
 
+def make_story_response_format(info: Dict) -> Dict:
+    """JSON schema asking for exactly one paragraph per page."""
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "picture_book_story",
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "pages": {
+                        "type": "array",
+                        "description": "The story text, one paragraph per page, in order.",
+                        "items": {"type": "string"},
+                        "minItems": info['pages'],
+                        "maxItems": info['pages'],
+                    }
+                },
+                "required": ["pages"],
+                "additionalProperties": False,
+            },
+        },
+    }
+
+
 def make_cover_prompt(info: Dict, story_text: str) -> str:
     return (
         f"Create a cover image for a children's book titled '{info['title']}'. "